@@ -2,15 +2,17 @@
 classifier.py
 
 Author: natelgrw
-Last Edited: 01/07/2026
+Last Edited: 10/15/2026
 
 Contains the DocumentClassifier class for automated document 
 classification using Mistral AI's Pixtral VLM.
 """
 
 import base64
+import hashlib
 import io
 import json
+import shelve
 import sys
 from typing import Dict, Optional, List
 from pathlib import Path
@@ -28,10 +30,15 @@ from global_vars import (
     MISTRAL_API_KEY,
     PIXTRAL_MODEL,
     MAX_IMAGE_SIZE,
-    JPEG_QUALITY
+    JPEG_QUALITY,
+    CACHE_DIR
 )
 
 
+# decodes the first JSON object in a response without slicing it out first
+JSON_DECODER = json.JSONDecoder()
+
+
 # ===== Document Classifier ===== #
 
 
@@ -40,18 +47,27 @@ class DocumentClassifier:
     Classifier for document images using Pixtral VLM.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    # classification prompt, built once per process by _get_prompt
+    _PROMPT: Optional[str] = None
+    
+    # in-memory classification results keyed by _cache_key
+    _RESULTS: Dict[str, Dict[str, str]] = {}
+    
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
         """
         Initialize document classifier.
         
         Args:
             api_key: Mistral API key. If None, uses environment variable.
+            use_cache: Whether to reuse results for previously classified images
         """
         self.api_key = api_key or MISTRAL_API_KEY
         if not self.api_key:
             raise ValueError("Mistral API key not provided")
         
         self.client = Mistral(api_key=self.api_key)
+        self.use_cache = use_cache
+        self.cache_path = CACHE_DIR / "classifications"
     
     def classify_images(self, image_paths: List[str]) -> Dict[str, str]:
         """
@@ -69,11 +85,11 @@ class DocumentClassifier:
         # use first image for classification
         image_path = Path(image_paths[0])
         
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image not found: {image_path}")
-        
         # load and prepare image
-        image = Image.open(image_path)
+        try:
+            image = Image.open(image_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image not found: {image_path}")
         
         # resize if too large
         if max(image.size) > MAX_IMAGE_SIZE:
@@ -81,17 +97,79 @@ class DocumentClassifier:
             new_size = (int(image.width * scale), int(image.height * scale))
             image = image.resize(new_size, Image.Resampling.LANCZOS)
         
-        # convert to base64
+        # encode as JPEG
         buffered = io.BytesIO()
-        image.save(buffered, format="JPEG", quality=JPEG_QUALITY)
-        base64_image = base64.b64encode(buffered.getvalue()).decode()
+        image.save(buffered, format="JPEG", quality=JPEG_QUALITY, optimize=False)
         
-        # classify using Pixtral
-        result = self._classify_with_pixtral(base64_image)
+        # reuse the result if this exact image was classified before
+        cache_key = self._cache_key(buffered.getbuffer())
+        result = self._load_cached(cache_key)
+        
+        if result is None:
+            # convert to base64, encoding straight from the buffer without a bytes copy
+            base64_image = base64.standard_b64encode(buffered.getbuffer()).decode()
+            
+            # classify using Pixtral
+            result = self._classify_with_pixtral(base64_image)
+            self._store_cached(cache_key, result)
         
         print(f"Classification: type={result['type']}, domain={result['domain']}")
         return result
     
+    @classmethod
+    def _cache_key(cls, image_bytes: memoryview) -> str:
+        """
+        Hash encoded image bytes together with the model and prompt.
+        
+        Args:
+            image_bytes: Encoded JPEG bytes sent to Pixtral
+            
+        Returns:
+            Hex digest identifying the classification request
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(PIXTRAL_MODEL.encode())
+        digest.update(cls._get_prompt().encode())
+        digest.update(image_bytes)
+        return digest.hexdigest()
+    
+    def _load_cached(self, cache_key: str) -> Optional[Dict[str, str]]:
+        """
+        Look up a previous classification in memory, then on disk.
+        """
+        if not self.use_cache:
+            return None
+        
+        result = self._RESULTS.get(cache_key)
+        if result is None:
+            try:
+                with shelve.open(str(self.cache_path), flag='r') as cache:
+                    result = cache.get(cache_key)
+            except Exception:
+                # cache not created yet or unreadable
+                return None
+            
+            if result is None:
+                return None
+            self._RESULTS[cache_key] = result
+        
+        return dict(result)
+    
+    def _store_cached(self, cache_key: str, result: Dict[str, str]) -> None:
+        """
+        Record a classification in memory and on disk.
+        """
+        if not self.use_cache:
+            return
+        
+        self._RESULTS[cache_key] = dict(result)
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(str(self.cache_path)) as cache:
+                cache[cache_key] = dict(result)
+        except Exception as e:
+            print(f"Warning: Could not write classification cache: {str(e)}")
+    
     def _classify_with_pixtral(self, base64_image: str) -> Dict[str, str]:
         """
         Classify document using Pixtral VLM.
@@ -102,7 +180,7 @@ class DocumentClassifier:
         Returns:
             Dictionary with 'type' and 'domain' keys
         """
-        prompt = self._create_prompt()
+        prompt = type(self)._get_prompt()
         
         try:
             response = self.client.chat.complete(
@@ -122,17 +200,21 @@ class DocumentClassifier:
         except Exception as e:
             raise Exception(f"Pixtral API classification failed: {str(e)}")
     
-    def _create_prompt(self) -> str:
+    @classmethod
+    def _get_prompt(cls) -> str:
         """
-        Create classification prompt for Pixtral.
+        Get classification prompt for Pixtral, creating it on first use.
         """
-        types_list = "\n".join([f"- {t}: {TYPE_DESCRIPTIONS[t]}" for t in DOCUMENT_TYPES])
-        domains_list = "\n".join([f"- {d}: {DOMAIN_DESCRIPTIONS[d]}" for d in DOMAINS])
+        if cls._PROMPT is None:
+            types_list = "\n".join([f"- {t}: {TYPE_DESCRIPTIONS[t]}" for t in DOCUMENT_TYPES])
+            domains_list = "\n".join([f"- {d}: {DOMAIN_DESCRIPTIONS[d]}" for d in DOMAINS])
+            
+            cls._PROMPT = CLASSIFICATION_PROMPT_TEMPLATE.format(
+                types_list=types_list,
+                domains_list=domains_list
+            )
         
-        return CLASSIFICATION_PROMPT_TEMPLATE.format(
-            types_list=types_list,
-            domains_list=domains_list
-        )
+        return cls._PROMPT
     
     def _parse_response(self, response_text: str) -> Dict[str, str]:
         """
@@ -143,13 +225,11 @@ class DocumentClassifier:
             
             # find JSON in response
             start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
             
-            if start_idx == -1 or end_idx == 0:
+            if start_idx == -1:
                 raise ValueError("No JSON object found in response")
             
-            json_str = response_text[start_idx:end_idx]
-            result = json.loads(json_str)
+            result, _ = JSON_DECODER.raw_decode(response_text, start_idx)
             
             # validate fields
             if 'type' not in result or 'domain' not in result:
@@ -172,16 +252,18 @@ class DocumentClassifier:
             raise ValueError(f"Failed to parse response: {str(e)}\nResponse: {response_text}")
 
 
-def characterize_images(image_paths: List[str], api_key: Optional[str] = None) -> Dict[str, str]:
+def characterize_images(image_paths: List[str], api_key: Optional[str] = None,
+                        use_cache: bool = True) -> Dict[str, str]:
     """
     Convenience function to characterize a list of images.
     
     Args:
         image_paths: List of paths to image files
         api_key: Optional Mistral API key
+        use_cache: Whether to reuse results for previously classified images
         
     Returns:
         Dictionary with 'type' and 'domain' keys
     """
-    classifier = DocumentClassifier(api_key)
+    classifier = DocumentClassifier(api_key, use_cache=use_cache)
     return classifier.classify_images(image_paths)
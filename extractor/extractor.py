@@ -2,15 +2,19 @@
 extractor.py
 
 Author: natelgrw
-Last Edited: 01/07/2026
+Last Edited: 10/15/2026
 
 Contains the PDFExtractor class for extracting .png images from input PDFs.
 """
 
+import os
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 from pdf2image import convert_from_path
+from PIL import Image
 
 from .preprocessing import preprocess_image
 
@@ -23,7 +27,8 @@ class PDFExtractor:
     Extracts .png images from input PDFs and saves to dataset directory.
     """
     
-    def __init__(self, dataset_dir: str = "dataset", dpi: int = 300, preprocess: bool = True):
+    def __init__(self, dataset_dir: str = "dataset", dpi: int = 300, preprocess: bool = True,
+                 workers: Optional[int] = None):
         """
         Initialize a PDFExtractor instance.
         
@@ -31,10 +36,12 @@ class PDFExtractor:
             dataset_dir: Base dataset directory
             dpi: DPI for PDF conversion
             preprocess: Whether to apply preprocessing
+            workers: Number of pages processed in parallel (defaults to CPU count)
         """
         self.dataset_dir = Path(dataset_dir)
         self.dpi = dpi
         self.preprocess = preprocess
+        self.workers = workers or os.cpu_count() or 1
         self.dataset_dir.mkdir(parents=True, exist_ok=True)
     
     def extract(self, pdf_path: str, doc_id: Optional[str] = None) -> Dict:
@@ -62,11 +69,12 @@ class PDFExtractor:
         images_dir = doc_dir / "images"
         
         # remove if exists
-        if doc_dir.exists():
+        try:
             shutil.rmtree(doc_dir)
+        except FileNotFoundError:
+            pass
         
-        doc_dir.mkdir(parents=True, exist_ok=True)
-        images_dir.mkdir(parents=True, exist_ok=True)
+        images_dir.mkdir(parents=True)
         
         # copy original PDF
         pdf_copy = doc_dir / pdf_path.name
@@ -76,26 +84,39 @@ class PDFExtractor:
         print(f"Document ID: {doc_id}")
         print(f"Output: {doc_dir}")
 
-        # convert PDF to images
-        images = convert_from_path(str(pdf_path), dpi=self.dpi)
-        page_files = []
-        
-        for idx, image in enumerate(images, start=1):
-            # preprocess if enabled
-            if self.preprocess:
-                image = preprocess_image(image)
+        with tempfile.TemporaryDirectory() as raw_dir:
+            # rasterize PDF to disk so only in-flight pages are held in memory
+            raw_files = convert_from_path(
+                str(pdf_path),
+                dpi=self.dpi,
+                output_folder=raw_dir,
+                paths_only=True,
+                thread_count=self.workers
+            )
+            page_files = [str(images_dir / f"page{idx}.png") for idx in range(1, len(raw_files) + 1)]
             
-            # save as PNG
-            page_file = images_dir / f"page{idx}.png"
-            image.save(page_file, format='PNG', optimize=True)
-            page_files.append(str(page_file))
+            # OpenCV and PNG encoding release the GIL, so pages scale across threads
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(self._save_page, raw_files, page_files))
         
-        print(f"Extracted {len(images)} pages\n")
+        print(f"Extracted {len(page_files)} pages\n")
         
         return {
             'document_id': doc_id,
             'pdf_path': str(pdf_copy),
             'images_dir': str(images_dir),
-            'num_pages': len(images),
+            'num_pages': len(page_files),
             'page_files': page_files
         }
+    
+    def _save_page(self, raw_file: str, page_file: str) -> None:
+        """
+        Load a single rasterized page, preprocess it if enabled, and save it as PNG.
+        
+        Args:
+            raw_file: Path to the page image rendered by pdf2image
+            page_file: Output path for the PNG file
+        """
+        with Image.open(raw_file) as raw:
+            image = preprocess_image(raw) if self.preprocess else raw
+            image.save(page_file, format='PNG', optimize=True)
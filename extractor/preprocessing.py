@@ -2,7 +2,7 @@
 preprocessing.py
 
 Author: natelgrw
-Last Edited: 01/07/2026
+Last Edited: 10/15/2026
 
 Image preprocessing functions for enhancing scanned document quality.
 """
@@ -12,6 +12,14 @@ import numpy as np
 from PIL import Image
 
 
+# ===== Constants ===== #
+
+
+# structuring elements are invariant, so build them once per process
+KERNEL_LARGE = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (51, 51))
+KERNEL_SMALL = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2, 2))
+
+
 # ===== Functions ===== #
 
 
@@ -21,6 +29,7 @@ def preprocess_image(image: Image.Image) -> Image.Image:
     
     Applies background normalization, bilateral filtering, adaptive thresholding,
     morphological operations, unsharp masking, and contrast enhancement.
+    Bilevel and near-uniform pages are returned as grayscale without filtering.
     
     Args:
         image: PIL Image to preprocess
@@ -28,42 +37,45 @@ def preprocess_image(image: Image.Image) -> Image.Image:
     Returns:
         Cleaned and sharpened PIL Image
     """
-    img_array = np.array(image)
+    # bilevel scans are already clean
+    if image.mode == '1':
+        return image.convert('L')
     
-    if len(img_array.shape) == 3:
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-    else:
-        gray = img_array.copy()
+    # grayscale in PIL, skipping the RGB ndarray copy and cvtColor pass
+    if image.mode != 'L':
+        image = image.convert('L')
     
-    # background normalization
-    kernel_large = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (51, 51))
-    background = cv2.morphologyEx(gray, cv2.MORPH_CLOSE, kernel_large)
-    normalized = cv2.divide(gray, background, scale=255)
+    # near-uniform pages (e.g. blank) have no strokes to enhance
+    low, high = image.getextrema()
+    if high - low < 32:
+        return image
+    
+    gray = np.asarray(image)
+    
+    # background normalization, dividing into the background buffer
+    background = cv2.morphologyEx(gray, cv2.MORPH_CLOSE, KERNEL_LARGE)
+    normalized = cv2.divide(gray, background, dst=background, scale=255)
     
     # bilateral filter
     smooth = cv2.bilateralFilter(normalized, d=9, sigmaColor=75, sigmaSpace=75)
     
-    # adaptive thresholding
+    # adaptive thresholding, in place
     adaptive = cv2.adaptiveThreshold(
         smooth,
         255,
         cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
         cv2.THRESH_BINARY,
         blockSize=15,
-        C=10
+        C=10,
+        dst=smooth
     )
     
-    # removing noise
-    kernel_small = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2, 2))
-    cleaned = cv2.morphologyEx(adaptive, cv2.MORPH_OPEN, kernel_small, iterations=1)
-    
-    # dilate slightly to thicken text
-    kernel_dilate = np.ones((1, 1), np.uint8)
-    thickened = cv2.dilate(cleaned, kernel_dilate, iterations=1)
+    # removing noise, in place
+    cleaned = cv2.morphologyEx(adaptive, cv2.MORPH_OPEN, KERNEL_SMALL, dst=adaptive, iterations=1)
     
-    # unsharp masking for sharpening
-    blurred = cv2.GaussianBlur(thickened, (0, 0), 4.0)
-    sharpened = cv2.addWeighted(thickened, 2.0, blurred, -1.0, 0)
+    # unsharp masking for sharpening, reusing the free normalized buffer
+    blurred = cv2.GaussianBlur(cleaned, (0, 0), 4.0, dst=normalized)
+    sharpened = cv2.addWeighted(cleaned, 2.0, blurred, -1.0, 0, dst=cleaned)
     
     # CLAHE for contrast enhancement
     clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
@@ -2,7 +2,7 @@
 global_vars.py
 
 Author: natelgrw
-Last Edited: 01/07/2026
+Last Edited: 10/15/2026
 
 Global configuration constants for the tex_transformer project.
 """
@@ -45,8 +45,11 @@ DOMAINS = [
 DPI = 200
 MAX_IMAGE_SIZE = 2048
 
-# image encoding quality
-JPEG_QUALITY = 85
+# local cache for classification results
+CACHE_DIR = Path.home() / '.cache' / 'tex_transformer'
+
+# image encoding quality (pages are near-binary after preprocessing)
+JPEG_QUALITY = 60
 
 # document type descriptions
 TYPE_DESCRIPTIONS = {
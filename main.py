@@ -2,7 +2,7 @@
 main.py
 
 Author: natelgrw
-Last Edited: 01/07/2026
+Last Edited: 10/15/2026
 
 The main pipeline for the TeX Transformer project.
 Extracts clean, processed .png images from an input PDF 
@@ -16,6 +16,11 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from extractor import PDFExtractor
 from classifier import characterize_images
 
@@ -30,11 +35,7 @@ def main():
     
     pdf_path = Path(sys.argv[1])
     
-    # validate PDF path
-    if not pdf_path.exists():
-        print(f"Error: PDF not found: {pdf_path}", file=sys.stderr)
-        sys.exit(1)
-    
+    # validate PDF path (existence is checked by PDFExtractor.extract)
     if not pdf_path.suffix.lower() == '.pdf':
         print(f"Error: Must be a PDF file: {pdf_path}", file=sys.stderr)
         sys.exit(1)
@@ -72,8 +73,11 @@ def main():
         
         # save JSON
         json_file = doc_dir / f"{doc_id}.json"
-        with json_file.open('w') as f:
-            json.dump(output_data, f, indent=2)
+        if orjson is not None:
+            json_file.write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            with json_file.open('w') as f:
+                json.dump(output_data, f, indent=2)
         
         print(f"{doc_id}: {classification['type']} / {classification['domain']}")
         